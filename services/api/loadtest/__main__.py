@@ -0,0 +1,218 @@
+"""Run the API under load against a temp DB and the bundled fake LLM.
+
+    python -m loadtest --duration 60 --concurrency 20 --out report.json
+
+Everything binds to 127.0.0.1; no external network is used.
+"""
+import argparse
+import csv
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import httpx
+
+from .fake_llm import FakeLLMConfig, start_fake_llm
+from .scenarios import SCENARIOS, Client, parse_mix
+from .stats import Stats
+
+API_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _wait_ready(base_url: str, proc: subprocess.Popen, timeout_s: float = 30.0) -> None:
+    deadline = time.time() + timeout_s
+    while time.time() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"API exited during startup (code {proc.returncode})")
+        try:
+            if httpx.get(f"{base_url}/tasks", timeout=1.0).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError("API did not become ready in time")
+
+
+def _start_api(args, db_path: Path, llm_url: str | None) -> tuple[subprocess.Popen, str]:
+    port = _free_port()
+    env = dict(os.environ)
+    env["DATABASE_URL"] = f"sqlite:///{db_path}"
+    env.pop("OPENAI_API_KEY", None)
+    if llm_url:
+        env["OPENAI_API_KEY"] = "loadtest"
+        env["OPENAI_BASE_URL"] = llm_url
+        env["PULSE_LLM_MAX_RETRIES"] = str(args.llm_max_retries)
+    cmd = [
+        sys.executable, "-m", "uvicorn", "pulse_api.main:app",
+        "--host", "127.0.0.1", "--port", str(port),
+        "--workers", str(args.workers), "--log-level", "warning",
+    ]
+    proc = subprocess.Popen(cmd, cwd=API_ROOT, env=env)
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        _wait_ready(base_url, proc)
+    except Exception:
+        proc.terminate()
+        raise
+    return proc, base_url
+
+
+def _seed(base_url: str, n_tasks: int, rng: random.Random) -> None:
+    with httpx.Client(base_url=base_url, timeout=60.0) as http:
+        for i in range(n_tasks):
+            http.post("/tasks", json={
+                "title": f"Seed task {i}",
+                "notes": "",
+                "priority": rng.choice((1, 2, 3)),
+                "estimate_min": rng.choice((15, 30, 45, 60, 90)),
+            })
+        http.post("/plan/generate", json={})
+
+
+def _run(base_url: str, args, mix: dict[str, int]) -> dict:
+    stats = Stats()
+    names = list(mix)
+    weights = [mix[n] for n in names]
+    stop_at = time.time() + args.duration
+
+    def worker(i: int):
+        rng = random.Random(args.seed + i)
+        client = Client(base_url, stats)
+        try:
+            while time.time() < stop_at:
+                SCENARIOS[rng.choices(names, weights)[0]](client, rng)
+        finally:
+            client.close()
+
+    t0 = time.perf_counter()
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(args.concurrency)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return stats.report(time.perf_counter() - t0)
+
+
+def _write_csv(path: str, report: dict) -> None:
+    with open(path, "w", newline="") as f:
+        w = csv.writer(f)
+        w.writerow(["route", "requests", "throughput_rps", "error_rate", "expected_errors", "p50_ms", "p95_ms", "p99_ms", "max_ms"])
+        for route, r in report["routes"].items():
+            lat = r["latency_ms"]
+            w.writerow([route, r["requests"], r["throughput_rps"], r["error_rate"], r["expected_errors"], lat["p50"], lat["p95"], lat["p99"], lat["max"]])
+
+
+def _print_summary(report: dict) -> None:
+    out = sys.stderr
+    print(f"{report['requests']} requests in {report['elapsed_s']}s — "
+          f"{report['throughput_rps']} req/s, error rate {report['error_rate']:.2%} "
+          f"(+{report['expected_errors']} expected)", file=out)
+    llm = report.get("fake_llm")
+    if llm:
+        print(f"fake LLM: {llm['requests']} calls, {llm['failed']} failed ({llm['error_rate']:.2%}), "
+              f"max_retries={report['config']['llm_max_retries']}", file=out)
+    print(f"{'route':32} {'reqs':>7} {'err%':>7} {'p50':>9} {'p95':>9} {'p99':>9}", file=out)
+    for route, r in report["routes"].items():
+        lat = r["latency_ms"]
+        print(f"{route:32} {r['requests']:>7} {r['error_rate']:>7.2%} "
+              f"{lat['p50']:>9} {lat['p95']:>9} {lat['p99']:>9}", file=out)
+
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(prog="python -m loadtest", description=__doc__.splitlines()[0])
+    p.add_argument("--duration", type=float, default=30.0, help="seconds to run (default 30)")
+    p.add_argument("--concurrency", type=int, default=10, help="concurrent virtual users")
+    p.add_argument("--workers", type=int, default=1,
+                   help="uvicorn worker processes; server_metrics is only reported with 1, "
+                        "since /metrics is per process")
+    p.add_argument("--mix", help="scenario weights, e.g. task_crud=3,event_burst=2 "
+                                 f"(scenarios: {', '.join(SCENARIOS)})")
+    p.add_argument("--seed-tasks", type=int, default=40, help="tasks created before the run")
+    p.add_argument("--seed", type=int, default=1, help="random seed")
+    p.add_argument("--no-ai", action="store_true", help="run with AI disabled (no fake LLM)")
+    p.add_argument("--llm-latency-ms", type=float, default=300.0)
+    p.add_argument("--llm-jitter-ms", type=float, default=100.0)
+    p.add_argument("--llm-error-rate", type=float, default=0.0,
+                   help="fraction of fake LLM calls answered with 500; the API retries and falls back, "
+                        "so compare fake_llm.failed in the report rather than route error rates")
+    p.add_argument("--llm-max-retries", type=int, default=2,
+                   help="PULSE_LLM_MAX_RETRIES for the API's OpenAI client (SDK default 2)")
+    p.add_argument("--out", help="write the JSON report here (default: stdout)")
+    p.add_argument("--csv", help="also write a per-route CSV report here")
+    args = p.parse_args(argv)
+
+    try:
+        mix = parse_mix(args.mix)
+    except ValueError as e:
+        p.error(str(e))
+
+    llm_server = None
+    llm_config = None
+    llm_url = None
+    if not args.no_ai:
+        llm_config = FakeLLMConfig(
+            latency_ms=args.llm_latency_ms,
+            jitter_ms=args.llm_jitter_ms,
+            error_rate=args.llm_error_rate,
+        )
+        llm_server = start_fake_llm(llm_config)
+        llm_url = f"http://127.0.0.1:{llm_server.server_address[1]}/v1"
+
+    with tempfile.TemporaryDirectory(prefix="pulse-load-") as tmp:
+        proc, base_url = _start_api(args, Path(tmp) / "pulse.db", llm_url)
+        try:
+            _seed(base_url, args.seed_tasks, random.Random(args.seed))
+            report = _run(base_url, args, mix)
+            # /metrics is per process; with several workers it would describe
+            # whichever one answered, so leave it out rather than mislead.
+            report["server_metrics"] = None
+            if args.workers == 1:
+                try:
+                    report["server_metrics"] = httpx.get(f"{base_url}/metrics", timeout=5.0).json()
+                except (httpx.HTTPError, ValueError):
+                    pass
+        finally:
+            proc.terminate()
+            proc.wait(timeout=10)
+            if llm_server:
+                llm_server.shutdown()
+
+    report["fake_llm"] = llm_config.stats() if llm_config else None
+    report["config"] = {
+        "duration_s": args.duration,
+        "concurrency": args.concurrency,
+        "workers": args.workers,
+        "mix": mix,
+        "ai": not args.no_ai,
+        "llm_latency_ms": args.llm_latency_ms,
+        "llm_jitter_ms": args.llm_jitter_ms,
+        "llm_error_rate": args.llm_error_rate,
+        "llm_max_retries": args.llm_max_retries,
+    }
+
+    raw = json.dumps(report, indent=2)
+    if args.out:
+        Path(args.out).write_text(raw + "\n")
+    else:
+        print(raw)
+    if args.csv:
+        _write_csv(args.csv, report)
+    _print_summary(report)
+    return 1 if report["requests"] == 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+"""Minimal OpenAI-compatible server for load tests.
+
+Implements just enough of ``POST /v1/responses`` (plain and ``stream=True``)
+for ``pulse_api.ai.llm`` to work unmodified when ``OPENAI_BASE_URL`` points
+here. Latency and error rate are configurable so runs can model a slow or
+flaky provider. ``stream_fail_after`` ends streams with ``response.failed``
+after that many text deltas, the way a provider fails mid-response.
+"""
+import json
+import random
+import sys
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+CANNED_TEXT = (
+    "Good progress on the main block today. "
+    "Context switches after lunch slowed things down. "
+    "Tomorrow, start with the blocked item while energy is high."
+)
+
+
+class FakeLLMConfig:
+    def __init__(self, latency_ms: float = 300.0, jitter_ms: float = 100.0, error_rate: float = 0.0, chunk_ms: float = 20.0,
+                 stream_fail_after: int | None = None):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.chunk_ms = chunk_ms
+        self.stream_fail_after = stream_fail_after
+        self._lock = threading.Lock()
+        self._counts = {"requests": 0, "served": 0, "streamed": 0, "failed": 0}
+
+    def count(self, key: str) -> None:
+        with self._lock:
+            self._counts[key] += 1
+
+    def stats(self) -> dict:
+        """What the fake provider saw, including failures the API retried or swallowed."""
+        with self._lock:
+            out = dict(self._counts)
+        out["error_rate"] = round(out["failed"] / out["requests"], 4) if out["requests"] else 0.0
+        return out
+
+    def delay(self) -> float:
+        ms = self.latency_ms + random.uniform(-self.jitter_ms, self.jitter_ms)
+        return max(0.0, ms) / 1000.0
+
+
+def _response_obj(model: str, text: str) -> dict:
+    return {
+        "id": f"resp_{uuid.uuid4().hex}",
+        "object": "response",
+        "created_at": int(time.time()),
+        "model": model,
+        "status": "completed",
+        "output": [{
+            "type": "message",
+            "id": f"msg_{uuid.uuid4().hex}",
+            "status": "completed",
+            "role": "assistant",
+            "content": [{"type": "output_text", "text": text, "annotations": []}],
+        }],
+        "parallel_tool_calls": False,
+        "tool_choice": "auto",
+        "tools": [],
+    }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    config: FakeLLMConfig
+
+    def log_message(self, fmt, *args):
+        pass
+
+    def _json(self, status: int, body: dict):
+        raw = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(raw)))
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            req = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            req = {}
+
+        if not self.path.rstrip("/").endswith("/responses"):
+            self._json(404, {"error": {"message": f"Unknown path {self.path}", "type": "invalid_request_error"}})
+            return
+
+        self.config.count("requests")
+        time.sleep(self.config.delay())
+        if random.random() < self.config.error_rate:
+            self.config.count("failed")
+            self._json(500, {"error": {"message": "Injected failure", "type": "server_error"}})
+            return
+
+        model = req.get("model") or "fake-model"
+        if req.get("stream"):
+            self.config.count("streamed")
+            self._stream(model)
+        else:
+            self.config.count("served")
+            self._json(200, _response_obj(model, CANNED_TEXT))
+
+    def _stream(self, model: str):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+        resp = _response_obj(model, CANNED_TEXT)
+        item_id = resp["output"][0]["id"]
+        seq = 0
+
+        def send(event: dict):
+            nonlocal seq
+            event["sequence_number"] = seq
+            seq += 1
+            self.wfile.write(f"event: {event['type']}\ndata: {json.dumps(event)}\n\n".encode())
+            self.wfile.flush()
+
+        send({"type": "response.created", "response": dict(resp, status="in_progress", output=[])})
+        for i, word in enumerate(CANNED_TEXT.split(" ")):
+            if i == self.config.stream_fail_after:
+                self.config.count("failed")
+                error = {"code": "server_error", "message": "Injected stream failure"}
+                send({"type": "response.failed", "response": dict(resp, status="failed", error=error)})
+                return
+            time.sleep(self.config.chunk_ms / 1000.0)
+            send({
+                "type": "response.output_text.delta",
+                "item_id": item_id,
+                "output_index": 0,
+                "content_index": 0,
+                "delta": word + " ",
+                "logprobs": [],
+            })
+        send({"type": "response.completed", "response": resp})
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # Clients dropping keep-alive connections (e.g. the API shutting down) is normal.
+        if isinstance(sys.exc_info()[1], (ConnectionResetError, BrokenPipeError)):
+            return
+        super().handle_error(request, client_address)
+
+
+def start_fake_llm(config: FakeLLMConfig, host: str = "127.0.0.1", port: int = 0) -> ThreadingHTTPServer:
+    """Start the fake server on a daemon thread; returns the bound server."""
+    handler = type("FakeLLMHandler", (_Handler,), {"config": config})
+    server = _Server((host, port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
@@ -0,0 +1,142 @@
+"""Weighted request mixes that mimic how the web app drives the API."""
+import random
+import time
+
+import httpx
+
+from .stats import Stats
+
+EVENT_KINDS = ("started", "done", "blocked", "deferred")
+
+
+class Client:
+    """httpx wrapper that records every call under a route template."""
+
+    def __init__(self, base_url: str, stats: Stats, timeout: float = 60.0):
+        self.http = httpx.Client(base_url=base_url, timeout=timeout)
+        self.stats = stats
+
+    def close(self):
+        self.http.close()
+
+    def call(self, method: str, route: str, url: str, expected: tuple[int, ...] = (), **kw) -> httpx.Response | None:
+        t0 = time.perf_counter()
+        try:
+            resp = self.http.request(method, url, **kw)
+            status = resp.status_code
+        except httpx.HTTPError:
+            resp, status = None, 0
+        self.stats.record(f"{method} {route}", time.perf_counter() - t0, status, expected=status in expected)
+        return resp
+
+    def stream(self, route: str, url: str) -> None:
+        t0 = time.perf_counter()
+        status = 0
+        try:
+            with self.http.stream("GET", url) as resp:
+                status = resp.status_code
+                for _ in resp.iter_bytes():
+                    pass
+        except httpx.HTTPError:
+            status = 0
+        self.stats.record(f"GET {route}", time.perf_counter() - t0, status)
+
+
+def _json(resp: httpx.Response | None):
+    if resp is None or resp.status_code >= 400:
+        return None
+    try:
+        return resp.json()
+    except ValueError:
+        return None
+
+
+def _task_ids(c: Client) -> list[int]:
+    tasks = _json(c.call("GET", "/tasks", "/tasks")) or []
+    return [int(t["id"]) for t in tasks]
+
+
+def task_crud(c: Client, rng: random.Random):
+    created = _json(c.call("POST", "/tasks", "/tasks", json={
+        "title": f"Load task {rng.randrange(1_000_000)}",
+        "notes": "",
+        "priority": rng.choice((1, 2, 3)),
+        "estimate_min": rng.choice((15, 30, 45, 60, 90)),
+    }))
+    if created:
+        c.call("PATCH", "/tasks/{id}", f"/tasks/{created['id']}", json={"priority": rng.choice((1, 2, 3))})
+    c.call("GET", "/tasks", "/tasks")
+
+
+def event_burst(c: Client, rng: random.Random, size: int = 10):
+    ids = _task_ids(c)
+    if not ids:
+        return
+    for _ in range(size):
+        c.call("POST", "/events", "/events", json={"kind": rng.choice(EVENT_KINDS), "task_id": rng.choice(ids)})
+
+
+def plan_storm(c: Client, rng: random.Random):
+    c.call("POST", "/plan/generate", "/plan/generate", json={})
+    for _ in range(rng.randint(1, 3)):
+        c.call("POST", "/plan/replan", "/plan/replan")
+
+
+def move_drag(c: Client, rng: random.Random):
+    # Other users replan between our read and our move, so a 404 for a task
+    # or block that is no longer there is the app working as designed.
+    plan = _json(c.call("GET", "/plan/today", "/plan/today"))
+    if not plan:
+        return
+    locked = set(plan.get("locked_block_ids", []))
+    blocks = [b for b in plan.get("blocks", []) if b["id"] not in locked]
+    sources = [b for b in blocks if b.get("tasks")]
+    if not sources:
+        return
+    src = rng.choice(sources)
+    dst = rng.choice(blocks)
+    task = rng.choice(src["tasks"])
+    c.call("POST", "/plan/move-task", "/plan/move-task", expected=(404,), json={
+        "task_id": task["id"],
+        "from_block_id": src["id"],
+        "to_block_id": dst["id"],
+        "to_index": rng.randint(0, len(dst.get("tasks", []))),
+    })
+
+
+def review(c: Client, rng: random.Random):
+    if rng.random() < 0.5:
+        c.stream("/review/today/stream", "/review/today/stream")
+    else:
+        c.call("GET", "/review/today", "/review/today")
+    c.call("GET", "/review/history", "/review/history")
+
+
+SCENARIOS = {
+    "task_crud": task_crud,
+    "event_burst": event_burst,
+    "plan_storm": plan_storm,
+    "move_drag": move_drag,
+    "review": review,
+}
+
+DEFAULT_MIX = {
+    "task_crud": 30,
+    "event_burst": 25,
+    "plan_storm": 15,
+    "move_drag": 25,
+    "review": 5,
+}
+
+
+def parse_mix(raw: str | None) -> dict[str, int]:
+    """Parse ``name=weight,name=weight``; unknown names are an error."""
+    if not raw:
+        return dict(DEFAULT_MIX)
+    mix = {}
+    for part in raw.split(","):
+        name, _, weight = part.strip().partition("=")
+        if name not in SCENARIOS:
+            raise ValueError(f"Unknown scenario: {name}")
+        mix[name] = int(weight or 1)
+    return mix
@@ -0,0 +1,68 @@
+import math
+import threading
+
+
+def percentile(sorted_vals: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_vals:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100.0 * len(sorted_vals)))
+    return sorted_vals[rank - 1]
+
+
+class Stats:
+    """Thread-safe per-route latency and status collector.
+
+    Statuses a scenario marks as ``expected`` (e.g. a 404 from acting on a
+    stale plan) are reported as ``expected_errors`` and kept out of
+    ``error_rate``.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._latencies: dict[str, list[float]] = {}
+        self._statuses: dict[str, dict[int, int]] = {}
+        self._expected: dict[str, int] = {}
+
+    def record(self, route: str, seconds: float, status: int, expected: bool = False) -> None:
+        with self._lock:
+            self._latencies.setdefault(route, []).append(seconds)
+            codes = self._statuses.setdefault(route, {})
+            codes[status] = codes.get(status, 0) + 1
+            if expected:
+                self._expected[route] = self._expected.get(route, 0) + 1
+
+    def report(self, elapsed_s: float) -> dict:
+        with self._lock:
+            routes = {}
+            total = errors = expected_total = 0
+            for route, lat in sorted(self._latencies.items()):
+                vals = sorted(lat)
+                codes = self._statuses[route]
+                expected = self._expected.get(route, 0)
+                errs = sum(n for code, n in codes.items() if code == 0 or code >= 400) - expected
+                total += len(vals)
+                errors += errs
+                expected_total += expected
+                routes[route] = {
+                    "requests": len(vals),
+                    "throughput_rps": round(len(vals) / elapsed_s, 2) if elapsed_s else 0.0,
+                    "error_rate": round(errs / len(vals), 4),
+                    "expected_errors": expected,
+                    "status_codes": {str(k): v for k, v in sorted(codes.items())},
+                    "latency_ms": {
+                        "p50": round(percentile(vals, 50) * 1000, 2),
+                        "p95": round(percentile(vals, 95) * 1000, 2),
+                        "p99": round(percentile(vals, 99) * 1000, 2),
+                        "max": round(vals[-1] * 1000, 2),
+                        "mean": round(sum(vals) / len(vals) * 1000, 2),
+                    },
+                }
+        return {
+            "elapsed_s": round(elapsed_s, 2),
+            "requests": total,
+            "throughput_rps": round(total / elapsed_s, 2) if elapsed_s else 0.0,
+            "error_rate": round(errors / total, 4) if total else 0.0,
+            "expected_errors": expected_total,
+            "routes": routes,
+        }
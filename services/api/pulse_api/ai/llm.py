@@ -1,10 +1,18 @@
+from typing import Iterator
 from openai import OpenAI
-from ..core.config import llm_model
+from ..core.config import llm_max_retries, llm_model
 
-client = OpenAI()
+_client: OpenAI | None = None
+
+def _get_client() -> OpenAI:
+    # Created on first use so the API can boot without OPENAI_API_KEY.
+    global _client
+    if _client is None:
+        _client = OpenAI(max_retries=llm_max_retries())
+    return _client
 
 def generate_text(system: str, user: str) -> str:
-    resp = client.responses.create(
+    resp = _get_client().responses.create(
         model=llm_model(),
         input=[
             {"role": "system", "content": system},
@@ -15,3 +23,39 @@ def generate_text(system: str, user: str) -> str:
         return resp.output_text.strip()
     except Exception:
         return str(resp).strip()
+
+def stream_text(system: str, user: str) -> Iterator[str]:
+    # Not a generator: the request is made here, so provider errors raise
+    # before the caller has committed to a streaming response.
+    stream = _get_client().responses.create(
+        model=llm_model(),
+        input=[
+            {"role": "system", "content": system},
+            {"role": "user", "content": user},
+        ],
+        stream=True,
+    )
+    return _text_deltas(stream)
+
+class LLMStreamError(RuntimeError):
+    """The provider ended a stream with a failure after it had started."""
+
+def _failure_detail(event) -> str:
+    if event.type == "error":
+        return getattr(event, "message", None) or "stream error"
+    resp = getattr(event, "response", None)
+    error = getattr(resp, "error", None)
+    incomplete = getattr(resp, "incomplete_details", None)
+    return (
+        getattr(error, "message", None)
+        or getattr(incomplete, "reason", None)
+        or event.type
+    )
+
+def _text_deltas(stream) -> Iterator[str]:
+    for event in stream:
+        kind = getattr(event, "type", "")
+        if kind == "response.output_text.delta":
+            yield event.delta
+        elif kind in ("response.failed", "response.incomplete", "error"):
+            raise LLMStreamError(_failure_detail(event))
@@ -26,15 +26,77 @@ Write a calm 2–3 sentence explanation for a UI banner.
 No hype. No jargon. Don’t repeat the bullet list verbatim.
 """.strip()
 
-def end_of_day_review_prompt(planned: list[str], done: list[str], blocked: list[str]) -> str:
-    planned_txt = "\n".join(f"- {x}" for x in planned) if planned else "- (none)"
-    done_txt = "\n".join(f"- {x}" for x in done) if done else "- (none)"
-    blocked_txt = "\n".join(f"- {x}" for x in blocked) if blocked else "- (none)"
+CHARS_PER_TOKEN = 4
+MAX_ITEM_CHARS = 80
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 chars per token); good enough for budgeting."""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+def _dedupe(items: list[str], seen: set[str]) -> list[str]:
+    out = []
+    for x in items:
+        x = " ".join((x or "").split())
+        if len(x) > MAX_ITEM_CHARS:
+            x = x[:MAX_ITEM_CHARS - 1].rstrip() + "…"
+        key = x.lower()
+        if not x or key in seen:
+            continue
+        seen.add(key)
+        out.append(x)
+    return out
+
+def _fit_section(items: list[str], budget: int) -> tuple[str, int]:
+    """Render as many bullets as fit in `budget` tokens, summarizing the rest."""
+    if not items:
+        return "- (none)", estimate_tokens("- (none)")
+    lines: list[str] = []
+    used = 0
+    for n, x in enumerate(items):
+        line = f"- {x}"
+        cost = estimate_tokens(line) + 1
+        rest = len(items) - n - 1
+        reserve = estimate_tokens(f"- …and {rest} more") + 1 if rest else 0
+        if used + cost + reserve > budget:
+            left = len(items) - n
+            more = f"- …and {left} more" if lines else f"- ({left} item(s) omitted)"
+            lines.append(more)
+            used += estimate_tokens(more) + 1
+            break
+        lines.append(line)
+        used += cost
+    return "\n".join(lines), used
+
+def end_of_day_review_prompt(
+    planned: list[str],
+    done: list[str],
+    blocked: list[str],
+    budget_tokens: int | None = None,
+) -> str:
+    """Build the review prompt, keeping the item lists within `budget_tokens`.
+
+    Blocked items are kept first (they drive the "friction" paragraph), then
+    completed, then whatever planned items were not already listed. Titles
+    are whitespace-normalized, truncated and deduplicated; lists that do
+    not fit end with an "…and N more" line. With no budget, every item is
+    listed.
+    """
+    seen: set[str] = set()
+    blocked_items = _dedupe(blocked, seen)
+    done_items = _dedupe(done, seen)
+    open_items = _dedupe(planned, seen)
+
+    budget = budget_tokens if budget_tokens is not None else 10**9
+    blocked_txt, used = _fit_section(blocked_items, budget)
+    done_txt, n = _fit_section(done_items, budget - used)
+    used += n
+    open_txt, _ = _fit_section(open_items, budget - used)
+
     return f"""
 Write a short end-of-day review.
 
-Planned today:
-{planned_txt}
+Planned today: {len(planned)} task(s). Not yet completed or blocked:
+{open_txt}
 
 Completed:
 {done_txt}
@@ -9,3 +9,15 @@ def llm_model() -> str:
 def cors_origins() -> list[str]:
     raw = os.getenv("CORS_ORIGINS", "http://localhost:3000,http://127.0.0.1:3000")
     return [x.strip() for x in raw.split(",") if x.strip()]
+
+def review_prompt_budget() -> int:
+    return int(os.getenv("PULSE_REVIEW_PROMPT_TOKENS", "1500"))
+
+def event_retention_days() -> int:
+    return int(os.getenv("PULSE_EVENT_RETENTION_DAYS", "90"))
+
+def archive_dir() -> str:
+    return os.getenv("PULSE_ARCHIVE_DIR", "./archive")
+
+def llm_max_retries() -> int:
+    return int(os.getenv("PULSE_LLM_MAX_RETRIES", "2"))
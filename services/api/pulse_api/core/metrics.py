@@ -0,0 +1,20 @@
+import threading
+
+_lock = threading.Lock()
+_stats: dict[str, dict] = {}
+
+def observe(name: str, value: float) -> None:
+    """Record one sample for an in-process metric (count/total/last/max)."""
+    with _lock:
+        s = _stats.setdefault(name, {"count": 0, "total": 0.0, "last": 0.0, "max": 0.0})
+        s["count"] += 1
+        s["total"] += value
+        s["last"] = value
+        s["max"] = max(s["max"], value)
+
+def snapshot() -> dict[str, dict]:
+    with _lock:
+        out = {}
+        for name, s in _stats.items():
+            out[name] = dict(s, avg=(s["total"] / s["count"]) if s["count"] else 0.0)
+        return out
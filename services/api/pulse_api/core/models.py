@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy import Column, Integer, String, DateTime, UniqueConstraint
 from datetime import datetime
 from .db import Base
 
@@ -19,7 +19,7 @@ class DayEvent(Base):
     kind = Column(String, nullable=False)      # started, done, blocked, deferred
     task_id = Column(Integer, nullable=True)
     meta = Column(String, default="")
-    at = Column(DateTime, default=datetime.utcnow)
+    at = Column(DateTime, default=datetime.utcnow, index=True)
 
 class DayPlan(Base):
     __tablename__ = "day_plans"
@@ -28,3 +28,25 @@ class DayPlan(Base):
     plan_json = Column(String, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow)
+
+class DayRollup(Base):
+    __tablename__ = "day_rollups"
+    id = Column(Integer, primary_key=True, index=True)
+    date = Column(String, unique=True, index=True)  # YYYY-MM-DD
+    planned_count = Column(Integer, default=0)
+    done_count = Column(Integer, default=0)
+    blocked_count = Column(Integer, default=0)
+    deferred_count = Column(Integer, default=0)
+    planned_min = Column(Integer, default=0)
+    actual_min = Column(Integer, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
+class DayRollupItem(Base):
+    __tablename__ = "day_rollup_items"
+    __table_args__ = (UniqueConstraint("date", "task_id", "kind"),)
+    id = Column(Integer, primary_key=True, index=True)
+    date = Column(String, nullable=False, index=True)  # YYYY-MM-DD
+    task_id = Column(Integer, nullable=False)
+    kind = Column(String, nullable=False)      # planned, started, done, blocked, deferred
+    minutes = Column(Integer, default=0)       # planned: estimate, done: actual
+    at = Column(DateTime, default=datetime.utcnow)
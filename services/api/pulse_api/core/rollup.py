@@ -0,0 +1,188 @@
+from datetime import date, datetime, time, timedelta, timezone
+from sqlalchemy import insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from . import models
+
+COUNTED_KINDS = {"blocked": "blocked_count", "deferred": "deferred_count"}
+
+_rollups = models.DayRollup.__table__
+_items = models.DayRollupItem.__table__
+
+
+# Rollup days are local calendar days, like DayPlan.date; DayEvent.at is
+# naive UTC. These two helpers are the only place the two meet.
+def local_day(at_utc: datetime) -> date:
+    return at_utc.replace(tzinfo=timezone.utc).astimezone().date()
+
+
+def utc_bounds(day: date) -> tuple[datetime, datetime]:
+    """[start, end) of a local day as naive UTC, for filtering DayEvent.at."""
+    def to_utc(d: date) -> datetime:
+        return datetime.combine(d, time.min).astimezone(timezone.utc).replace(tzinfo=None)
+    return to_utc(day), to_utc(day + timedelta(days=1))
+
+
+def _insert_ignore(db: Session, table, values: dict) -> bool:
+    """INSERT … ON CONFLICT DO NOTHING; True if this call inserted the row.
+
+    Concurrent writers race on the unique constraint instead of on a
+    check-then-insert, so exactly one of them wins.
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect in ("sqlite", "postgresql"):
+        mod = sqlite if dialect == "sqlite" else postgresql
+        stmt = mod.insert(table).values(**values).on_conflict_do_nothing()
+        return db.execute(stmt).rowcount == 1
+    try:
+        with db.begin_nested():
+            db.execute(insert(table).values(**values))
+        return True
+    except IntegrityError:
+        return False
+
+
+def _ensure_row(db: Session, day: str) -> None:
+    _insert_ignore(db, _rollups, {
+        "date": day,
+        "planned_count": 0,
+        "done_count": 0,
+        "blocked_count": 0,
+        "deferred_count": 0,
+        "planned_min": 0,
+        "actual_min": 0,
+        "updated_at": datetime.utcnow(),
+    })
+
+
+def _bump(db: Session, day: str, **deltas: int) -> None:
+    """Atomically add to aggregate columns (no read-modify-write in Python)."""
+    values = {name: _rollups.c[name] + n for name, n in deltas.items()}
+    values["updated_at"] = datetime.utcnow()
+    db.execute(update(_rollups).where(_rollups.c.date == day).values(**values))
+
+
+def _add_item(db: Session, day: str, task_id: int, kind: str, minutes: int = 0, at: datetime | None = None) -> bool:
+    return _insert_ignore(db, _items, {
+        "date": day,
+        "task_id": task_id,
+        "kind": kind,
+        "minutes": minutes,
+        "at": at or datetime.utcnow(),
+    })
+
+
+def apply_plan(db: Session, day: str, plan_dict: dict) -> None:
+    """Add a saved plan's tasks to the day's planned set.
+
+    Planned is the union of every task planned that day, so replans that
+    drop completed tasks don't shrink it; minutes are only added for newly
+    planned tasks. Does not commit; callers fold this into the plan write's
+    transaction.
+    """
+    _ensure_row(db, day)
+    for b in plan_dict.get("blocks", []):
+        for t in b.get("tasks", []):
+            minutes = int(t.get("estimate_min") or 0)
+            if _add_item(db, day, int(t["id"]), "planned", minutes=minutes):
+                _bump(db, day, planned_count=1, planned_min=minutes)
+
+
+def apply_event(db: Session, day: str, ev: models.DayEvent) -> None:
+    """Fold a single event into its day's rollup.
+
+    Counts are per distinct task, so repeated events for the same task do
+    not inflate them. Actual minutes come from the started → done interval
+    when a start was seen that day, and fall back to the task's estimate
+    otherwise. Does not commit.
+    """
+    _ensure_row(db, day)
+    if not ev.task_id:
+        return
+    tid = int(ev.task_id)
+    at = ev.at or datetime.utcnow()
+
+    if ev.kind == "started":
+        _add_item(db, day, tid, "started", at=at)
+    elif ev.kind == "done":
+        minutes = _actual_minutes(db, day, tid, at)
+        if _add_item(db, day, tid, "done", minutes=minutes, at=at):
+            _bump(db, day, done_count=1, actual_min=minutes)
+    elif ev.kind in COUNTED_KINDS:
+        if _add_item(db, day, tid, ev.kind, at=at):
+            _bump(db, day, **{COUNTED_KINDS[ev.kind]: 1})
+
+
+def _actual_minutes(db: Session, day: str, task_id: int, at: datetime) -> int:
+    started = db.execute(
+        select(_items.c.at)
+        .where(_items.c.date == day, _items.c.task_id == task_id, _items.c.kind == "started")
+    ).scalar()
+    if started:
+        return max(0, int((at - started).total_seconds() // 60))
+    task = db.query(models.Task).filter(models.Task.id == task_id).first()
+    return int(task.estimate_min or 0) if task else 0
+
+
+def get_rollup(db: Session, day: str) -> models.DayRollup | None:
+    return db.query(models.DayRollup).filter(models.DayRollup.date == day).first()
+
+
+def task_ids(db: Session, day: str, kind: str) -> list[int]:
+    """Task ids recorded for ``kind`` on ``day``, in the order first seen."""
+    rows = db.execute(
+        select(_items.c.task_id)
+        .where(_items.c.date == day, _items.c.kind == kind)
+        .order_by(_items.c.id)
+    )
+    return [int(r[0]) for r in rows]
+
+
+def as_api_rollup(day: str, row: models.DayRollup | None) -> dict:
+    if not row:
+        return {
+            "date": day,
+            "planned": 0,
+            "done": 0,
+            "blocked": 0,
+            "deferred": 0,
+            "planned_min": 0,
+            "actual_min": 0,
+        }
+    return {
+        "date": day,
+        "planned": int(row.planned_count or 0),
+        "done": int(row.done_count or 0),
+        "blocked": int(row.blocked_count or 0),
+        "deferred": int(row.deferred_count or 0),
+        "planned_min": int(row.planned_min or 0),
+        "actual_min": int(row.actual_min or 0),
+    }
+
+
+def history(db: Session, start: date, end: date) -> list[dict]:
+    """One entry per day in [start, end], zero-filled where nothing happened."""
+    rows = (
+        db.query(models.DayRollup)
+        .filter(models.DayRollup.date >= start.isoformat())
+        .filter(models.DayRollup.date <= end.isoformat())
+        .all()
+    )
+    by_day = {r.date: r for r in rows}
+    out = []
+    d = start
+    while d <= end:
+        key = d.isoformat()
+        out.append(as_api_rollup(key, by_day.get(key)))
+        d += timedelta(days=1)
+    return out
+
+
+def task_titles(db: Session, ids: list[int]) -> list[str]:
+    if not ids:
+        return []
+    rows = db.query(models.Task).filter(models.Task.id.in_(ids)).all()
+    titles = {int(r.id): r.title for r in rows}
+    return [titles[i] for i in ids if i in titles]
@@ -1 +1,78 @@
+from datetime import datetime
+from typing import Literal
+from pydantic import BaseModel, ConfigDict, Field
 
+TaskStatus = Literal["todo", "doing", "done", "blocked"]
+EventKind = Literal["started", "done", "blocked", "deferred"]
+
+class TaskCreate(BaseModel):
+    title: str = Field(min_length=1)
+    notes: str | None = ""
+    priority: int = Field(2, ge=1, le=3)       # 1 high, 2 med, 3 low
+    estimate_min: int = Field(30, ge=1)
+
+class TaskPatch(BaseModel):
+    title: str | None = Field(None, min_length=1)
+    notes: str | None = None
+    priority: int | None = Field(None, ge=1, le=3)
+    estimate_min: int | None = Field(None, ge=1)
+    status: TaskStatus | None = None
+
+class TaskOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    title: str
+    notes: str | None = ""
+    priority: int
+    estimate_min: int
+    status: str
+    due_at: datetime | None = None
+
+class EventIn(BaseModel):
+    kind: EventKind
+    task_id: int | None = None
+    meta: str | None = ""
+
+class WorkHours(BaseModel):
+    start: str = Field("09:00", pattern=r"^\d{1,2}:\d{2}$")
+    end: str = Field("17:30", pattern=r"^\d{1,2}:\d{2}$")
+
+class PlanPreferences(BaseModel):
+    buffer_pct: float = Field(0.2, ge=0, le=0.9)
+    deep_work_first: bool = True
+    max_tasks_per_block: int = Field(6, ge=1)
+
+class PlanGenerateIn(BaseModel):
+    work_hours: WorkHours = Field(default_factory=WorkHours)
+    preferences: PlanPreferences = Field(default_factory=PlanPreferences)
+
+class TimeBlockOut(BaseModel):
+    id: str
+    label: str
+    start: str
+    end: str
+    tasks: list[TaskOut] = []
+
+class NowOut(BaseModel):
+    task: TaskOut | None = None
+    reason: str | None = None
+
+class TodayPlanOut(BaseModel):
+    date: str
+    blocks: list[TimeBlockOut]
+    now: NowOut
+    buffer_min: int = 0
+    changes: list[str] = []
+    locked_block_ids: list[str] = []
+    explanation: str | None = None
+
+class LockBlockIn(BaseModel):
+    block_id: str
+    locked: bool
+
+class MoveTaskIn(BaseModel):
+    task_id: int
+    from_block_id: str
+    to_block_id: str
+    to_index: int = Field(0, ge=0)
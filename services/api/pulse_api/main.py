@@ -2,10 +2,15 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from .core.db import Base, engine
+from .core import models
 from .core.config import cors_origins
-from .routes import tasks, events, plan, review
+from .core.metrics import snapshot
+from .routes import tasks, events, plan, review, transfer
 
 Base.metadata.create_all(bind=engine)
+# create_all skips tables that already exist, so add newer indexes explicitly.
+for idx in models.DayEvent.__table__.indexes:
+    idx.create(bind=engine, checkfirst=True)
 
 app = FastAPI(title="Flowbit Pulse API")
 
@@ -21,3 +26,8 @@ app.include_router(tasks.router, prefix="/tasks", tags=["tasks"])
 app.include_router(events.router, prefix="/events", tags=["events"])
 app.include_router(plan.router, prefix="/plan", tags=["plan"])
 app.include_router(review.router, prefix="/review", tags=["review"])
+app.include_router(transfer.router, tags=["transfer"])
+
+@app.get("/metrics", tags=["metrics"])
+def metrics():
+    return snapshot()
@@ -0,0 +1,183 @@
+"""Event log retention: archive old ``day_events`` and compact the live DB.
+
+    python -m pulse_api.retention run [--days 90] [--archive-dir ./archive] [--dry-run] [--no-vacuum]
+    python -m pulse_api.retention read [--from YYYY-MM-DD] [--to YYYY-MM-DD]
+
+Events older than the retention window are written, one gzip'd NDJSON file
+per local day (the same days as ``day_plans`` and ``day_rollups``), to
+``<archive-dir>/day_events/YYYY/MM/``. Each day is folded into
+``day_rollups`` (replayed from its plan and events if no rollup exists
+yet), then deleted from the live table. Safe to run from cron.
+"""
+import argparse
+import gzip
+import json
+import os
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Iterator
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from .core import models
+from .core.config import archive_dir, event_retention_days
+from .core.db import Base, SessionLocal, engine
+from .core.rollup import apply_event, apply_plan, get_rollup, local_day, utc_bounds
+
+CHUNK_SIZE = 1000
+
+
+def _event_dict(ev: models.DayEvent) -> dict:
+    return {
+        "id": ev.id,
+        "kind": ev.kind,
+        "task_id": ev.task_id,
+        "meta": ev.meta or "",
+        "at": ev.at.isoformat() if ev.at else None,
+    }
+
+
+def _day_dir(root: Path, day: date) -> Path:
+    return root / "day_events" / f"{day.year:04d}" / f"{day.month:02d}"
+
+
+def _archive_day(db: Session, root: Path, day: date, cutoff: datetime) -> tuple[int, Path | None]:
+    start, end = utc_bounds(day)
+    end = min(end, cutoff)
+    q = (
+        db.query(models.DayEvent)
+        .filter(models.DayEvent.at >= start)
+        .filter(models.DayEvent.at < end)
+        .order_by(models.DayEvent.id)
+    )
+
+    key = day.isoformat()
+    replay = get_rollup(db, key) is None
+    if replay:
+        plan_row = db.query(models.DayPlan).filter(models.DayPlan.date == key).first()
+        if plan_row:
+            apply_plan(db, key, json.loads(plan_row.plan_json))
+    out_dir = _day_dir(root, day)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    tmp = out_dir / f".{key}.ndjson.gz.tmp"
+
+    count = 0
+    first_id = None
+    with gzip.open(tmp, "wt", encoding="utf-8") as f:
+        for ev in q.yield_per(CHUNK_SIZE):
+            if first_id is None:
+                first_id = ev.id
+            f.write(json.dumps(_event_dict(ev)) + "\n")
+            if replay:
+                apply_event(db, key, ev)
+            count += 1
+
+    if not count:
+        tmp.unlink()
+        return 0, None
+
+    # Naming by first id makes a rerun after a crash overwrite, not duplicate.
+    path = out_dir / f"{key}.{first_id}.ndjson.gz"
+    os.replace(tmp, path)
+
+    (
+        db.query(models.DayEvent)
+        .filter(models.DayEvent.at >= start)
+        .filter(models.DayEvent.at < end)
+        .delete(synchronize_session=False)
+    )
+    db.commit()
+    return count, path
+
+
+def archive_events(db: Session, days: int, root: Path, dry_run: bool = False) -> dict:
+    """Archive and delete events older than ``days`` days, one day at a time."""
+    cutoff, _ = utc_bounds(date.today() - timedelta(days=days))
+    summary = {"cutoff": cutoff.isoformat(), "archived_events": 0, "days": 0, "files": []}
+
+    if dry_run:
+        summary["archived_events"] = (
+            db.query(models.DayEvent).filter(models.DayEvent.at < cutoff).count()
+        )
+        return summary
+
+    while True:
+        oldest = (
+            db.query(models.DayEvent.at)
+            .filter(models.DayEvent.at < cutoff)
+            .order_by(models.DayEvent.at)
+            .first()
+        )
+        if not oldest:
+            break
+        count, path = _archive_day(db, root, local_day(oldest[0]), cutoff)
+        summary["archived_events"] += count
+        summary["days"] += 1
+        if path:
+            summary["files"].append(str(path))
+    return summary
+
+
+def compact() -> None:
+    """Reclaim space freed by archiving (VACUUM needs its own autocommit connection)."""
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        if engine.dialect.name == "sqlite":
+            conn.execute(text("VACUUM"))
+        elif engine.dialect.name == "postgresql":
+            conn.execute(text(f"VACUUM ANALYZE {models.DayEvent.__tablename__}"))
+
+
+def iter_archived_events(root: Path, start: date | None = None, end: date | None = None) -> Iterator[dict]:
+    """Stream archived events in day order without loading whole files."""
+    base = root / "day_events"
+    if not base.exists():
+        return
+    for path in sorted(base.glob("*/*/*.ndjson.gz")):
+        day = date.fromisoformat(path.name.split(".", 1)[0])
+        if (start and day < start) or (end and day > end):
+            continue
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(prog="python -m pulse_api.retention", description=__doc__.splitlines()[0])
+    sub = p.add_subparsers(dest="cmd", required=True)
+
+    run = sub.add_parser("run", help="archive old events, fold into rollups, compact the DB")
+    run.add_argument("--days", type=int, default=event_retention_days(), help="keep this many days live")
+    run.add_argument("--archive-dir", default=archive_dir())
+    run.add_argument("--dry-run", action="store_true", help="only report how many events would move")
+    run.add_argument("--no-vacuum", action="store_true", help="skip VACUUM after archiving")
+
+    read = sub.add_parser("read", help="stream archived events as NDJSON to stdout")
+    read.add_argument("--archive-dir", default=archive_dir())
+    read.add_argument("--from", dest="start", type=date.fromisoformat)
+    read.add_argument("--to", dest="end", type=date.fromisoformat)
+
+    args = p.parse_args(argv)
+
+    if args.cmd == "read":
+        for ev in iter_archived_events(Path(args.archive_dir), args.start, args.end):
+            sys.stdout.write(json.dumps(ev) + "\n")
+        return 0
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        summary = archive_events(db, args.days, Path(args.archive_dir), dry_run=args.dry_run)
+    finally:
+        db.close()
+    if summary["archived_events"] and not args.dry_run and not args.no_vacuum:
+        compact()
+        summary["vacuumed"] = True
+    print(json.dumps(summary, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,15 +1,18 @@
+from datetime import datetime
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
 from ..core.deps import get_db
 from ..core.schemas import EventIn
 from ..core import models
+from ..core.rollup import apply_event, local_day
 
 router = APIRouter()
 
 @router.post("")
 def post_event(body: EventIn, db: Session = Depends(get_db)):
-    ev = models.DayEvent(kind=body.kind, task_id=body.task_id, meta=body.meta or "")
+    ev = models.DayEvent(kind=body.kind, task_id=body.task_id, meta=body.meta or "", at=datetime.utcnow())
     db.add(ev)
+    apply_event(db, local_day(ev.at).isoformat(), ev)
     db.commit()
     return {"ok": True}
@@ -1,5 +1,5 @@
 import json
-from datetime import date, datetime, time as dtime
+from datetime import date, datetime
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
@@ -7,6 +7,7 @@ from ..core.deps import get_db
 from ..core.schemas import PlanGenerateIn, TodayPlanOut, LockBlockIn, MoveTaskIn
 from ..core import models
 from ..core.config import ai_enabled
+from ..core.rollup import apply_plan, utc_bounds
 
 from ..engine.planner import (
     TaskLite,
@@ -25,7 +26,8 @@ def _today_key() -> str:
     return date.today().isoformat()
 
 def _today_start():
-    return datetime.combine(date.today(), dtime.min)
+    # DayEvent.at is UTC; compare against local midnight expressed in UTC.
+    return utc_bounds(date.today())[0]
 
 def _load_tasks(db: Session) -> list[TaskLite]:
     rows = db.query(models.Task).all()
@@ -50,6 +52,7 @@ def _save_plan(db: Session, day: str, plan_dict: dict):
         existing.updated_at = datetime.utcnow()
     else:
         db.add(models.DayPlan(date=day, plan_json=raw))
+    apply_plan(db, day, plan_dict)
     db.commit()
 
 def _task_block_map(plan_dict: dict) -> dict[int, str]:
@@ -1,22 +1,30 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from datetime import date
+from datetime import date, timedelta
 import json
+import logging
 
 from ..core.deps import get_db
 from ..core import models
-from ..core.config import ai_enabled
-from ..ai.llm import generate_text
-from ..ai.prompts import SYSTEM_PULSE, end_of_day_review_prompt
+from ..core.config import ai_enabled, review_prompt_budget
+from ..core.metrics import observe
+from ..core.rollup import history, task_ids, task_titles
+from ..ai.llm import generate_text, stream_text
+from ..ai.prompts import SYSTEM_PULSE, end_of_day_review_prompt, estimate_tokens
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
-@router.get("/today")
-def review_today(db: Session = Depends(get_db)):
-    day = date.today().isoformat()
+MAX_HISTORY_DAYS = 366
+
+AI_DISABLED_REVIEW = "AI is disabled (no OPENAI_API_KEY). Set it to generate a daily review."
+REVIEW_FAILED = "Could not generate a review right now. Try again in a moment."
+
+def _review_prompt(db: Session, day: str) -> str | None:
     plan_row = db.query(models.DayPlan).filter(models.DayPlan.date == day).first()
     if not plan_row:
-        return {"date": day, "review": "No plan found for today yet."}
+        return None
 
     plan = json.loads(plan_row.plan_json)
 
@@ -25,12 +33,76 @@ def review_today(db: Session = Depends(get_db)):
         for t in b.get("tasks", []):
             planned.append(t.get("title", "Untitled task"))
 
-    done = [t.title for t in db.query(models.Task).filter(models.Task.status == "done").all()]
-    blocked = [t.title for t in db.query(models.Task).filter(models.Task.status == "blocked").all()]
+    done_ids = task_ids(db, day, "done")
+    blocked_ids = task_ids(db, day, "blocked")
+    done = task_titles(db, done_ids)
+    blocked = task_titles(db, [i for i in blocked_ids if i not in done_ids])
+
+    return end_of_day_review_prompt(planned, done, blocked, budget_tokens=review_prompt_budget())
+
+def _or_failed(chunks):
+    # Headers are already sent once streaming starts, so a provider failure
+    # mid-stream can only end the text, not change the status code.
+    try:
+        yield from chunks
+    except Exception as e:
+        logger.warning("Review stream failed: %s", e)
+        yield "\n\n" + REVIEW_FAILED
+
+@router.get("/today")
+def review_today(db: Session = Depends(get_db)):
+    day = date.today().isoformat()
+    prompt = _review_prompt(db, day)
+    if prompt is None:
+        return {"date": day, "review": "No plan found for today yet."}
 
     if ai_enabled():
-        text = generate_text(SYSTEM_PULSE, end_of_day_review_prompt(planned, done, blocked))
+        observe("review_prompt_tokens", estimate_tokens(prompt))
+        try:
+            text = generate_text(SYSTEM_PULSE, prompt)
+        except Exception:
+            raise HTTPException(status_code=502, detail=REVIEW_FAILED)
     else:
-        text = "AI is disabled (no OPENAI_API_KEY). Set it to generate a daily review."
+        text = AI_DISABLED_REVIEW
 
     return {"date": day, "review": text}
+
+@router.get("/today/stream")
+def review_today_stream(db: Session = Depends(get_db)):
+    day = date.today().isoformat()
+    prompt = _review_prompt(db, day)
+    if prompt is None:
+        chunks = iter(["No plan found for today yet."])
+    elif ai_enabled():
+        observe("review_prompt_tokens", estimate_tokens(prompt))
+        try:
+            chunks = _or_failed(stream_text(SYSTEM_PULSE, prompt))
+        except Exception:
+            raise HTTPException(status_code=502, detail=REVIEW_FAILED)
+    else:
+        chunks = iter([AI_DISABLED_REVIEW])
+    return StreamingResponse(chunks, media_type="text/plain; charset=utf-8")
+
+@router.get("/history")
+def review_history(
+    start: date | None = Query(None, alias="from"),
+    end: date | None = Query(None, alias="to"),
+    db: Session = Depends(get_db),
+):
+    end = end or date.today()
+    start = start or end - timedelta(days=6)
+    if start > end:
+        raise HTTPException(status_code=400, detail="'from' must be on or before 'to'")
+    if (end - start).days + 1 > MAX_HISTORY_DAYS:
+        raise HTTPException(status_code=400, detail=f"Range is limited to {MAX_HISTORY_DAYS} days")
+
+    days = history(db, start, end)
+    return {
+        "from": start.isoformat(),
+        "to": end.isoformat(),
+        "days": days,
+        "totals": {
+            k: sum(d[k] for d in days)
+            for k in ("planned", "done", "blocked", "deferred", "planned_min", "actual_min")
+        },
+    }
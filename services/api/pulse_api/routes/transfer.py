@@ -0,0 +1,59 @@
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy.exc import DataError, IntegrityError, SQLAlchemyError
+
+from ..core.db import SessionLocal
+from ..transfer import Importer, TransferError, iter_export
+
+router = APIRouter()
+
+@router.get("/export")
+def export_ndjson():
+    # iter_export opens a short connection per page, so the stream outlives
+    # the request scope without holding a DB lock between pages.
+    return StreamingResponse(
+        iter_export(),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="pulse-export.ndjson"'},
+    )
+
+def _import_failed(status: int, e: Exception, importer: Importer) -> HTTPException:
+    return HTTPException(
+        status_code=status,
+        detail={"error": str(e).splitlines()[0], "committed_lines": importer.committed},
+    )
+
+@router.post("/import")
+async def import_ndjson(request: Request, resume_from: int = 0):
+    """Import an NDJSON export streamed as the request body.
+
+    Bad input is a 400, rows that already exist a 409 and other database
+    errors a 503. Each reports ``committed_lines``; resend the same body
+    with ``?resume_from=<committed_lines>`` to continue.
+    """
+    db = SessionLocal()
+    importer = Importer(db, skip=resume_from)
+    buf = b""
+    try:
+        async for chunk in request.stream():
+            buf += chunk
+            *lines, buf = buf.split(b"\n")
+            for line in lines:
+                if importer.add(line.decode("utf-8")):
+                    await run_in_threadpool(importer.flush)
+        if buf:
+            importer.add(buf.decode("utf-8"))
+        return await run_in_threadpool(importer.finish)
+    except (TransferError, UnicodeDecodeError, DataError) as e:
+        await run_in_threadpool(db.rollback)
+        raise _import_failed(400, e, importer)
+    except IntegrityError as e:
+        # Usually rows that already exist: a non-empty DB or a wrong resume_from.
+        await run_in_threadpool(db.rollback)
+        raise _import_failed(409, e, importer)
+    except SQLAlchemyError as e:
+        await run_in_threadpool(db.rollback)
+        raise _import_failed(503, e, importer)
+    finally:
+        await run_in_threadpool(db.close)
@@ -0,0 +1,239 @@
+"""Streaming NDJSON export/import of a workspace.
+
+    python -m pulse_api.transfer export [-o dump.ndjson]
+    python -m pulse_api.transfer import dump.ndjson [--checkpoint dump.ckpt]
+
+The first line is a header; every other line is ``{"table": ..., "row": ...}``.
+Export reads each table in keyset pages (``id > last ORDER BY id LIMIT n``),
+each in its own short transaction, so a slow reader never holds a lock on
+the live DB. The flip side is that the export is not one consistent
+snapshot: rows written while it runs may or may not be included. Import
+inserts in batches, committing each, and reports how many lines are
+committed so an interrupted import can resume from there. Row ids are
+kept, so import into an empty database.
+"""
+import argparse
+import json
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from sqlalchemy import DateTime, func, insert, select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from .core import models
+from .core.db import Base, SessionLocal, engine
+
+FORMAT = "flowbit-pulse-export"
+VERSION = 1
+CHUNK_SIZE = 1000
+
+# Export order; rollups are included so archived days survive a move.
+TABLES = [models.Task, models.DayPlan, models.DayRollup, models.DayRollupItem, models.DayEvent]
+_BY_NAME = {m.__tablename__: m.__table__ for m in TABLES}
+
+
+def _encode(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def iter_export(bind: Engine = engine, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    """Yield the export in chunk-sized strings of NDJSON lines."""
+    yield json.dumps({"format": FORMAT, "version": VERSION, "exported_at": datetime.utcnow().isoformat()}) + "\n"
+    for model in TABLES:
+        table = model.__table__
+        last_id = None
+        while True:
+            q = select(table).order_by(table.c.id).limit(chunk_size)
+            if last_id is not None:
+                q = q.where(table.c.id > last_id)
+            # Fetch the page and release the connection before yielding.
+            with bind.connect() as conn:
+                rows = conn.execute(q).mappings().all()
+            if not rows:
+                break
+            last_id = rows[-1]["id"]
+            yield "".join(
+                json.dumps({"table": table.name, "row": {k: _encode(v) for k, v in row.items()}}) + "\n"
+                for row in rows
+            )
+            if len(rows) < chunk_size:
+                break
+
+
+class TransferError(ValueError):
+    pass
+
+
+class Importer:
+    """Batches NDJSON lines into per-table inserts.
+
+    ``add`` returns True once a batch is due; the caller then runs ``flush``
+    (which commits) wherever it is safe to do blocking DB work. Lines before
+    ``skip`` are counted but not inserted, which is how imports resume.
+    """
+
+    def __init__(self, db: Session, skip: int = 0, batch_size: int = CHUNK_SIZE):
+        self.db = db
+        self.skip = skip
+        self.batch_size = batch_size
+        self.lines = 0
+        self.committed = skip
+        self.counts: dict[str, int] = {name: 0 for name in _BY_NAME}
+        self._pending: dict[str, list[dict]] = {name: [] for name in _BY_NAME}
+        self._n_pending = 0
+
+    def add(self, line: str) -> bool:
+        line = line.strip()
+        if not line:
+            return False
+        self.lines += 1
+        if self.lines <= self.skip:
+            return False
+
+        try:
+            rec = json.loads(line)
+        except ValueError:
+            raise TransferError(f"Line {self.lines}: invalid JSON")
+        if not isinstance(rec, dict):
+            raise TransferError(f"Line {self.lines}: expected a JSON object")
+        if "format" in rec:
+            version = rec.get("version", 0)
+            if rec["format"] != FORMAT or not isinstance(version, int) or version > VERSION:
+                raise TransferError(f"Line {self.lines}: unsupported export {rec.get('format')} v{version}")
+            return False
+
+        name = rec.get("table")
+        table = _BY_NAME.get(name) if isinstance(name, str) else None
+        if table is None:
+            raise TransferError(f"Line {self.lines}: unknown table {rec.get('table')!r}")
+        row = rec.get("row")
+        if not isinstance(row, dict):
+            raise TransferError(f"Line {self.lines}: 'row' must be a JSON object")
+        try:
+            self._pending[table.name].append(self._decode(table, row))
+        except (TypeError, ValueError) as e:
+            raise TransferError(f"Line {self.lines}: {e}")
+        self._n_pending += 1
+        return self._n_pending >= self.batch_size
+
+    @staticmethod
+    def _decode(table, row: dict) -> dict:
+        out = {}
+        for col in table.columns:
+            if col.name not in row:
+                continue
+            v = row[col.name]
+            if v is not None and isinstance(col.type, DateTime):
+                try:
+                    v = datetime.fromisoformat(v)
+                except (TypeError, ValueError):
+                    raise ValueError(f"bad datetime for {table.name}.{col.name}: {v!r}")
+            out[col.name] = v
+        return out
+
+    def flush(self) -> int:
+        """Insert and commit everything pending; returns lines committed so far."""
+        for name, rows in self._pending.items():
+            if rows:
+                self.db.execute(insert(_BY_NAME[name]), rows)
+                self.counts[name] += len(rows)
+                self._pending[name] = []
+        self.db.commit()
+        self._n_pending = 0
+        self.committed = self.lines
+        return self.committed
+
+    def finish(self) -> dict:
+        self.flush()
+        _sync_sequences(self.db)
+        return {"lines": self.committed, "imported": self.counts}
+
+
+def _sync_sequences(db: Session) -> None:
+    # Explicit ids don't advance Postgres sequences; move them past the imported rows.
+    if db.get_bind().dialect.name != "postgresql":
+        return
+    for model in TABLES:
+        table = model.__table__
+        if db.execute(select(func.count()).select_from(table)).scalar():
+            db.execute(text(
+                f"SELECT setval(pg_get_serial_sequence('{table.name}', 'id'), "
+                f"(SELECT MAX(id) FROM {table.name}))"
+            ))
+    db.commit()
+
+
+def _write_checkpoint(path: Path, lines: int) -> None:
+    # Replace atomically so a crash mid-write never leaves a truncated count.
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(f"{lines}\n")
+    os.replace(tmp, path)
+
+
+def import_lines(importer: Importer, lines: Iterable[str], checkpoint: Path | None = None) -> dict:
+    for line in lines:
+        if importer.add(line):
+            done = importer.flush()
+            if checkpoint:
+                _write_checkpoint(checkpoint, done)
+    summary = importer.finish()
+    if checkpoint:
+        _write_checkpoint(checkpoint, summary["lines"])
+    return summary
+
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(prog="python -m pulse_api.transfer", description=__doc__.splitlines()[0])
+    sub = p.add_subparsers(dest="cmd", required=True)
+
+    exp = sub.add_parser("export", help="write all tasks, plans, rollups and events as NDJSON")
+    exp.add_argument("-o", "--output", help="file to write (default: stdout)")
+
+    imp = sub.add_parser("import", help="load an NDJSON export into DATABASE_URL")
+    imp.add_argument("input", help="export file, or - for stdin")
+    imp.add_argument("--checkpoint", type=Path, help="file recording committed lines; resumes from it if present")
+
+    args = p.parse_args(argv)
+    Base.metadata.create_all(bind=engine)
+
+    if args.cmd == "export":
+        out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+        try:
+            for chunk in iter_export():
+                out.write(chunk)
+        finally:
+            if args.output:
+                out.close()
+        return 0
+
+    skip = 0
+    if args.checkpoint and args.checkpoint.exists():
+        skip = int(args.checkpoint.read_text().strip() or 0)
+    src = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    db = SessionLocal()
+    importer = Importer(db, skip=skip)
+    try:
+        summary = import_lines(importer, src, checkpoint=args.checkpoint)
+    except (TransferError, SQLAlchemyError) as e:
+        db.rollback()
+        print(f"error: {str(e).splitlines()[0]}", file=sys.stderr)
+        print(f"{importer.committed} line(s) committed.", file=sys.stderr)
+        if isinstance(e, IntegrityError):
+            print("Rows already exist: import into an empty database, or fix --checkpoint "
+                  "if a previous run stopped after committing a batch.", file=sys.stderr)
+        return 1
+    finally:
+        db.close()
+        if src is not sys.stdin:
+            src.close()
+    print(json.dumps(summary, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,22 @@
+import os
+import tempfile
+
+# Point the app at a throwaway DB before anything imports pulse_api.core.db.
+_tmp = tempfile.mkdtemp(prefix="pulse-test-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmp}/pulse.db"
+os.environ.pop("OPENAI_API_KEY", None)
+
+import pytest
+
+from pulse_api.core.db import Base, SessionLocal, engine
+
+
+@pytest.fixture
+def db():
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
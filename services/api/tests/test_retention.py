@@ -0,0 +1,54 @@
+import json
+import time
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from pulse_api import retention
+from pulse_api.core import models
+from pulse_api.core.rollup import as_api_rollup, get_rollup
+
+
+@pytest.fixture
+def non_utc(monkeypatch):
+    monkeypatch.setenv("TZ", "America/Los_Angeles")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def _utc(local: datetime) -> datetime:
+    return local.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def test_archive_folds_plan_and_events_by_local_day(db, tmp_path, non_utc):
+    day = date.today() - timedelta(days=120)
+    task = models.Task(title="Old task", estimate_min=45)
+    db.add(task)
+    db.commit()
+    plan = {"blocks": [{"tasks": [{"id": task.id, "title": "Old task", "estimate_min": 45}]}]}
+    db.add(models.DayPlan(date=day.isoformat(), plan_json=json.dumps(plan)))
+    # 23:00 local is already the next day in UTC; it must stay on `day`.
+    late = datetime.combine(day, datetime.min.time()).replace(hour=23)
+    db.add(models.DayEvent(kind="started", task_id=task.id, at=_utc(late - timedelta(minutes=30))))
+    db.add(models.DayEvent(kind="done", task_id=task.id, at=_utc(late)))
+    db.add(models.DayEvent(kind="started", task_id=task.id, at=datetime.utcnow()))
+    db.commit()
+
+    summary = retention.archive_events(db, 90, tmp_path)
+
+    assert summary["archived_events"] == 2
+    assert summary["days"] == 1
+    assert db.query(models.DayEvent).count() == 1
+    assert as_api_rollup(day.isoformat(), get_rollup(db, day.isoformat())) == {
+        "date": day.isoformat(),
+        "planned": 1,
+        "done": 1,
+        "blocked": 0,
+        "deferred": 0,
+        "planned_min": 45,
+        "actual_min": 30,
+    }
+    archived = list(retention.iter_archived_events(tmp_path, day, day))
+    assert [e["kind"] for e in archived] == ["started", "done"]
@@ -0,0 +1,87 @@
+from datetime import date, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+
+from pulse_api.main import app
+
+
+@pytest.fixture
+def client(db):
+    return TestClient(app)
+
+
+def _today(client) -> dict:
+    today = date.today().isoformat()
+    body = client.get("/review/history", params={"from": today, "to": today}).json()
+    return body["days"][0]
+
+
+def _add_tasks(client, *estimates: int) -> list[int]:
+    return [
+        client.post("/tasks", json={"title": f"Task {i}", "estimate_min": m}).json()["id"]
+        for i, m in enumerate(estimates)
+    ]
+
+
+def test_history_zero_fills_days(client):
+    resp = client.get("/review/history", params={"from": "2025-03-01", "to": "2025-03-03"})
+    assert resp.status_code == 200
+    body = resp.json()
+    assert [d["date"] for d in body["days"]] == ["2025-03-01", "2025-03-02", "2025-03-03"]
+    assert all(d["planned"] == 0 and d["done"] == 0 for d in body["days"])
+    assert body["totals"]["planned"] == 0
+
+
+def test_history_defaults_to_last_seven_days(client):
+    body = client.get("/review/history").json()
+    assert body["to"] == date.today().isoformat()
+    assert body["from"] == (date.today() - timedelta(days=6)).isoformat()
+    assert len(body["days"]) == 7
+
+
+def test_history_rejects_reversed_range(client):
+    resp = client.get("/review/history", params={"from": "2025-03-02", "to": "2025-03-01"})
+    assert resp.status_code == 400
+
+
+def test_history_caps_range(client):
+    ok = client.get("/review/history", params={"from": "2024-01-01", "to": "2024-12-31"})
+    assert ok.status_code == 200 and len(ok.json()["days"]) == 366
+    resp = client.get("/review/history", params={"from": "2024-01-01", "to": "2025-01-01"})
+    assert resp.status_code == 400
+
+
+def test_events_update_rollup(client):
+    a, b = _add_tasks(client, 30, 45)
+    for kind, tid in [("done", a), ("done", a), ("blocked", b), ("deferred", b)]:
+        assert client.post("/events", json={"kind": kind, "task_id": tid}).status_code == 200
+
+    day = _today(client)
+    assert (day["done"], day["blocked"], day["deferred"]) == (1, 1, 1)
+    assert day["actual_min"] == 30
+
+
+def test_plan_routes_update_planned_set(client):
+    a, b = _add_tasks(client, 30, 45)
+    plan = client.post("/plan/generate", json={}).json()
+    day = _today(client)
+    assert (day["planned"], day["planned_min"]) == (2, 75)
+
+    # Moving a task within the plan doesn't count it twice.
+    src = next(bl for bl in plan["blocks"] if bl["tasks"])
+    dst = next(bl for bl in plan["blocks"] if bl["id"] != src["id"])
+    resp = client.post("/plan/move-task", json={
+        "task_id": src["tasks"][0]["id"], "from_block_id": src["id"], "to_block_id": dst["id"],
+    })
+    assert resp.status_code == 200
+    assert _today(client)["planned"] == 2
+
+    # Replanning drops the done task but keeps it in the planned set, and adds new tasks.
+    client.post("/events", json={"kind": "done", "task_id": a})
+    client.patch(f"/tasks/{a}", json={"status": "done"})
+    _add_tasks(client, 15)
+    replanned = client.post("/plan/replan").json()
+    assert a not in {t["id"] for bl in replanned["blocks"] for t in bl["tasks"]}
+    day = _today(client)
+    assert (day["planned"], day["planned_min"], day["done"]) == (3, 90, 1)
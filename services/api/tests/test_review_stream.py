@@ -0,0 +1,114 @@
+import json
+from datetime import date
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from loadtest.fake_llm import CANNED_TEXT, FakeLLMConfig, start_fake_llm
+from pulse_api.ai import llm
+from pulse_api.ai.prompts import end_of_day_review_prompt, estimate_tokens
+from pulse_api.core import models
+from pulse_api.core.metrics import snapshot
+from pulse_api.routes import review
+
+
+@pytest.fixture
+def client(db):
+    app = FastAPI()
+    app.include_router(review.router, prefix="/review")
+    return TestClient(app)
+
+
+@pytest.fixture
+def fake_llm(monkeypatch):
+    config = FakeLLMConfig(latency_ms=0, jitter_ms=0, chunk_ms=0)
+    server = start_fake_llm(config)
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    monkeypatch.setenv("PULSE_LLM_MAX_RETRIES", "0")
+    monkeypatch.setenv("OPENAI_BASE_URL", f"http://127.0.0.1:{server.server_address[1]}/v1")
+    monkeypatch.setattr(llm, "_client", None)
+    yield config
+    server.shutdown()
+
+
+def _plan_today(db):
+    plan = {"blocks": [{"tasks": [{"id": 1, "title": "Write spec", "estimate_min": 30}]}]}
+    db.add(models.DayPlan(date=date.today().isoformat(), plan_json=json.dumps(plan)))
+    db.commit()
+
+
+def test_stream_returns_model_text(db, client, fake_llm):
+    _plan_today(db)
+    with client.stream("GET", "/review/today/stream") as resp:
+        assert resp.status_code == 200
+        body = "".join(resp.iter_text())
+    assert body.strip() == CANNED_TEXT
+
+
+def test_stream_provider_failure_is_an_error(db, client, fake_llm):
+    _plan_today(db)
+    fake_llm.error_rate = 1.0
+    resp = client.get("/review/today/stream")
+    assert resp.status_code == 502
+    assert resp.json()["detail"] == review.REVIEW_FAILED
+
+
+def test_stream_failure_mid_response_ends_text(db, client, fake_llm):
+    _plan_today(db)
+    fake_llm.stream_fail_after = 3
+    with client.stream("GET", "/review/today/stream") as resp:
+        assert resp.status_code == 200
+        body = "".join(resp.iter_text())
+    assert body.startswith(" ".join(CANNED_TEXT.split(" ")[:3]))
+    assert body.endswith(review.REVIEW_FAILED)
+    assert fake_llm.stats()["failed"] == 1
+
+
+def _prompts_observed() -> int:
+    return snapshot().get("review_prompt_tokens", {}).get("count", 0)
+
+
+def test_prompt_tokens_observed_only_for_llm_calls(db, client, fake_llm, monkeypatch):
+    _plan_today(db)
+    before = _prompts_observed()
+    client.get("/review/today")
+    assert _prompts_observed() == before + 1
+
+    monkeypatch.delenv("OPENAI_API_KEY")
+    client.get("/review/today")
+    client.get("/review/today/stream")
+    assert _prompts_observed() == before + 1
+
+
+def test_stream_without_plan(client, fake_llm):
+    resp = client.get("/review/today/stream")
+    assert resp.status_code == 200
+    assert resp.text == "No plan found for today yet."
+
+
+def test_stream_with_ai_disabled(db, client, monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    _plan_today(db)
+    resp = client.get("/review/today/stream")
+    assert resp.status_code == 200
+    assert resp.text == review.AI_DISABLED_REVIEW
+
+
+def test_review_prompt_respects_budget():
+    planned = [f"Planned task number {i}" for i in range(400)]
+    done = [f"Done task number {i}" for i in range(200)]
+    blocked = [f"Blocked task number {i}" for i in range(50)]
+    budget = 300
+
+    prompt = end_of_day_review_prompt(planned, done, blocked, budget_tokens=budget)
+
+    template = estimate_tokens(end_of_day_review_prompt([], [], []))
+    assert estimate_tokens(prompt) <= budget + template
+    assert "- …and " in prompt
+    assert "Blocked task number 0" in prompt
+
+
+def test_review_prompt_dedupes_titles():
+    prompt = end_of_day_review_prompt(["Ship it", "ship  it"], ["Ship it"], [])
+    assert prompt.count("Ship it") == 1
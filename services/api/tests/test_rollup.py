@@ -0,0 +1,73 @@
+import threading
+from datetime import datetime, timedelta
+
+from pulse_api.core import models
+from pulse_api.core.db import SessionLocal
+from pulse_api.core.rollup import apply_event, apply_plan, get_rollup, task_ids
+
+DAY = "2026-03-02"
+
+
+def _tasks(db, n, estimate_min=30):
+    tasks = [models.Task(title=f"T{i}", estimate_min=estimate_min) for i in range(n)]
+    db.add_all(tasks)
+    db.commit()
+    return [t.id for t in tasks]
+
+
+def _plan(ids, estimate_min=30):
+    return {"blocks": [{"tasks": [{"id": i, "estimate_min": estimate_min} for i in ids]}]}
+
+
+def test_concurrent_done_events_on_fresh_day(db):
+    ids = _tasks(db, 40)
+    errors = []
+
+    def post(tid):
+        s = SessionLocal()
+        try:
+            ev = models.DayEvent(kind="done", task_id=tid, at=datetime.utcnow())
+            s.add(ev)
+            apply_event(s, DAY, ev)
+            s.commit()
+        except Exception as e:
+            errors.append(e)
+        finally:
+            s.close()
+
+    threads = [threading.Thread(target=post, args=(tid,)) for tid in ids]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    row = get_rollup(db, DAY)
+    assert row.done_count == 40
+    assert row.actual_min == 40 * 30
+    assert sorted(task_ids(db, DAY, "done")) == sorted(ids)
+
+
+def test_repeated_events_count_once(db):
+    (tid,) = _tasks(db, 1)
+    t0 = datetime(2026, 3, 2, 9, 0)
+    for kind, at in (("started", t0), ("started", t0 + timedelta(minutes=5)),
+                     ("done", t0 + timedelta(minutes=25)), ("done", t0 + timedelta(minutes=40))):
+        apply_event(db, DAY, models.DayEvent(kind=kind, task_id=tid, at=at))
+    db.commit()
+
+    row = get_rollup(db, DAY)
+    assert row.done_count == 1
+    assert row.actual_min == 25
+
+
+def test_replan_keeps_union_of_planned_tasks(db):
+    ids = _tasks(db, 5)
+    apply_plan(db, DAY, _plan(ids))
+    for tid in ids[:3]:
+        apply_event(db, DAY, models.DayEvent(kind="done", task_id=tid, at=datetime.utcnow()))
+    apply_plan(db, DAY, _plan(ids[3:]))
+    db.commit()
+
+    row = get_rollup(db, DAY)
+    assert (row.planned_count, row.planned_min, row.done_count) == (5, 150, 3)
@@ -0,0 +1,30 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+API_ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_app_imports():
+    from pulse_api.main import app
+
+    paths = set(app.openapi()["paths"])
+    assert {"/tasks", "/events", "/plan/generate", "/review/history", "/export", "/import"} <= paths
+
+
+def test_loadtest_harness_runs(tmp_path):
+    out = tmp_path / "report.json"
+    proc = subprocess.run(
+        [sys.executable, "-m", "loadtest", "--duration", "2", "--concurrency", "3",
+         "--seed-tasks", "5", "--llm-latency-ms", "5", "--llm-jitter-ms", "0",
+         "--llm-max-retries", "0", "--out", str(out)],
+        cwd=API_ROOT, capture_output=True, text=True, timeout=120,
+    )
+    assert proc.returncode == 0, proc.stderr
+
+    report = json.loads(out.read_text())
+    assert report["requests"] > 0
+    assert report["error_rate"] == 0
+    assert report["fake_llm"]["requests"] > 0
+    assert "POST /events" in report["routes"]
@@ -0,0 +1,98 @@
+from datetime import datetime
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from pulse_api.core import models
+from pulse_api.core.db import SessionLocal
+from pulse_api.routes import transfer as transfer_routes
+from pulse_api.transfer import Importer, TransferError, import_lines, iter_export
+
+HEADER = '{"format": "flowbit-pulse-export", "version": 1}'
+
+
+@pytest.fixture
+def client(db):
+    app = FastAPI()
+    app.include_router(transfer_routes.router)
+    return TestClient(app)
+
+
+def test_paused_export_does_not_block_writes(db):
+    db.add_all([models.Task(title=f"T{i}") for i in range(5)])
+    db.commit()
+
+    export = iter_export(chunk_size=2)
+    next(export)  # header
+    next(export)  # first page; the client is now "slow"
+
+    other = SessionLocal()
+    try:
+        other.add(models.Task(title="written mid-export"))
+        other.commit()
+    finally:
+        other.close()
+
+    rest = "".join(export)
+    assert "T4" in rest
+
+
+def test_roundtrip(db):
+    db.add(models.Task(title="A", created_at=datetime(2026, 1, 2, 3, 4)))
+    db.add(models.DayEvent(kind="done", task_id=1, at=datetime(2026, 1, 2, 5, 0)))
+    db.commit()
+    dump = "".join(iter_export())
+
+    db.query(models.DayEvent).delete()
+    db.query(models.Task).delete()
+    db.commit()
+
+    importer = Importer(db)
+    for line in dump.splitlines():
+        importer.add(line)
+    summary = importer.finish()
+
+    assert summary["imported"]["tasks"] == 1
+    assert summary["imported"]["day_events"] == 1
+    assert "".join(iter_export()).splitlines()[1:] == dump.splitlines()[1:]
+
+
+@pytest.mark.parametrize("line", [
+    "5",
+    '{"table": "tasks", "row": 5}',
+    '{"table": "tasks", "row": {"id": 1, "title": "x", "created_at": "not a date"}}',
+    '{"table": "nope", "row": {}}',
+    '{"table": ["tasks"], "row": {}}',
+    '{"format": "flowbit-pulse-export", "version": "x"}',
+])
+def test_bad_lines_raise_transfer_error(db, line):
+    importer = Importer(db)
+    importer.add(HEADER)
+    with pytest.raises(TransferError, match="Line 2"):
+        importer.add(line)
+
+
+def test_import_bad_line_is_400_with_committed_lines(client):
+    body = "\n".join([HEADER, '{"table": "tasks", "row": {"id": 1, "title": "ok"}}', "5"]) + "\n"
+    resp = client.post("/import", content=body)
+    assert resp.status_code == 400
+    assert resp.json()["detail"]["committed_lines"] == 0
+    assert "Line 3" in resp.json()["detail"]["error"]
+
+
+def test_import_existing_rows_is_409(client):
+    body = "\n".join([HEADER, '{"table": "tasks", "row": {"id": 1, "title": "ok"}}']) + "\n"
+    assert client.post("/import", content=body).status_code == 200
+    resp = client.post("/import", content=body)
+    assert resp.status_code == 409
+    assert resp.json()["detail"]["committed_lines"] == 0
+
+
+def test_checkpoint_records_committed_lines(db, tmp_path):
+    ckpt = tmp_path / "dump.ckpt"
+    rows = [f'{{"table": "tasks", "row": {{"id": {i}, "title": "t{i}"}}}}' for i in range(1, 6)]
+    summary = import_lines(Importer(db, batch_size=2), [HEADER, *rows], checkpoint=ckpt)
+    assert summary["lines"] == 6
+    assert ckpt.read_text() == "6\n"
+    assert [p.name for p in tmp_path.iterdir()] == ["dump.ckpt"]